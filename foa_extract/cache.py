@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import contextvars
+import logging
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path("~/.cache/foa_extract").expanduser()
+
+# Rendered pages are reused for this long (seconds)
+RENDER_TTL = 6 * 60 * 60
+
+# Extracted results are reused this long (seconds) before being revalidated
+INGEST_TTL = 60 * 60
+
+_cache = None
+
+_bypass = contextvars.ContextVar("foa_extract_bypass_cache", default=False)
+
+
+def refresh_requested() -> bool:
+    """``FOA_NOCACHE=1`` or ``bypass_cache()`` skips cache reads; fresh results are still stored."""
+    return _bypass.get() or os.environ.get("FOA_NOCACHE") == "1"
+
+
+@contextmanager
+def bypass_cache():
+    """Skip cache reads in this context, including asyncio tasks and
+    ``asyncio.to_thread`` calls started from it."""
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def get_cache():
+    """Return the shared on-disk cache, or ``None`` if diskcache is missing."""
+    global _cache
+    if diskcache is None:
+        return None
+    if _cache is None:
+        _cache = diskcache.Cache(str(CACHE_DIR))
+        logger.debug("Using disk cache at %s", CACHE_DIR)
+    return _cache
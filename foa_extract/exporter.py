@@ -1,17 +1,48 @@
 from __future__ import annotations
 
-import json
+import csv
+import io
 import logging
+import multiprocessing
 import os
-import tempfile
+import queue
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 
-import pandas as pd
-
 from foa_extract.models import FundingOpportunity
 
 logger = logging.getLogger(__name__)
 
+# Below this many opportunities, process start-up costs more than it saves
+EXPORT_POOL_THRESHOLD = 8
+
+# A forked worker could inherit locks held by the caller's threads (logging,
+# Exporter writers, HTTP clients), so start workers from a clean process
+_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+CSV_COLUMN_ORDER = [
+    "foa_id", "title", "agency", "open_date", "close_date",
+    "eligibility", "description", "source_url", "tags",
+    "award_ceiling", "award_floor", "expected_awards",
+]
+
+
+def _csv_fieldnames(export_dict: dict) -> list[str]:
+    existing_columns = [c for c in CSV_COLUMN_ORDER if c in export_dict]
+    extra_columns = [c for c in export_dict if c not in CSV_COLUMN_ORDER]
+    return existing_columns + extra_columns
+
+
+def _chunked(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
 
 def ensure_output_dir(out_dir: str | Path) -> Path:
     path = Path(out_dir)
@@ -19,51 +50,188 @@ def ensure_output_dir(out_dir: str | Path) -> Path:
     return path
 
 
-def export_json(opportunity: FundingOpportunity, out_dir: str | Path) -> Path:
-    out_path = ensure_output_dir(out_dir) / "foa.json"
-    data = opportunity.model_dump()
+def _tmp_path(out_path: Path) -> Path:
+    # Unique per process and thread, so concurrent writers never share one
+    return out_path.with_name(f"{out_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
 
-    fd, tmp_path = tempfile.mkstemp(dir=str(out_dir), suffix=".json.tmp")
+
+def _atomic_write(out_path: Path, data: bytes) -> None:
+    """Write ``data`` next to ``out_path`` and swap it in with ``os.replace``."""
+    tmp_path = _tmp_path(out_path)
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write("\n")
-        os.replace(tmp_path, str(out_path))
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, out_path)
     except Exception:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+        tmp_path.unlink(missing_ok=True)
         raise
 
+
+def _json_bytes(opportunity: FundingOpportunity) -> bytes:
+    # Serialized straight from the model by pydantic-core, no dict round-trip
+    return (opportunity.model_dump_json(indent=2) + "\n").encode("utf-8")
+
+
+def _csv_bytes(opportunity: FundingOpportunity) -> bytes:
+    export_dict = opportunity.to_export_dict()
+    fieldnames = _csv_fieldnames(export_dict)
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, lineterminator="\n")
+    writer.writeheader()
+    writer.writerow(export_dict)
+    return buffer.getvalue().encode("utf-8")
+
+
+_SERIALIZERS = {"json": _json_bytes, "csv": _csv_bytes}
+
+
+def export_json(opportunity: FundingOpportunity, out_dir: str | Path) -> Path:
+    out_path = ensure_output_dir(out_dir) / "foa.json"
+    _atomic_write(out_path, _json_bytes(opportunity))
+
     logger.info("JSON exported to %s", out_path)
     return out_path
 
 
 def export_csv(opportunity: FundingOpportunity, out_dir: str | Path) -> Path:
     out_path = ensure_output_dir(out_dir) / "foa.csv"
-    export_dict = opportunity.to_export_dict()
+    _atomic_write(out_path, _csv_bytes(opportunity))
+
+    logger.info("CSV exported to %s", out_path)
+    return out_path
+
+
+class Exporter:
+    """Serialize on the calling thread and write files on a background thread.
 
-    df = pd.DataFrame([export_dict])
+    Use it as a context manager. ``submit`` encodes one opportunity and
+    queues its files; the writer thread flushes earlier files meanwhile.
+    Leaving the block waits for the queued writes and re-raises the first
+    write error, if any.
+    """
 
-    column_order = [
-        "foa_id", "title", "agency", "open_date", "close_date",
-        "eligibility", "description", "source_url", "tags",
-        "award_ceiling", "award_floor", "expected_awards",
-    ]
-    existing_columns = [c for c in column_order if c in df.columns]
-    extra_columns = [c for c in df.columns if c not in column_order]
-    df = df[existing_columns + extra_columns]
+    def __init__(self, formats: list[str] | None = None, max_pending: int = 4) -> None:
+        formats = formats or ["json", "csv"]
+        self.formats = [fmt for fmt in _SERIALIZERS if fmt in formats]
+        self._queue: queue.Queue[tuple[Path, bytes] | None] = queue.Queue(maxsize=max_pending)
+        self._error: Exception | None = None
+        self._writer = threading.Thread(target=self._drain, name="foa-export", daemon=True)
 
-    fd, tmp_path = tempfile.mkstemp(dir=str(out_dir), suffix=".csv.tmp")
+    def __enter__(self) -> Exporter:
+        self._writer.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def submit(self, opportunity: FundingOpportunity, out_dir: str | Path) -> dict[str, Path]:
+        if self._error is not None:
+            raise self._error
+
+        path = ensure_output_dir(out_dir)
+        results = {}
+        for fmt in self.formats:
+            out_path = path / f"foa.{fmt}"
+            self._queue.put((out_path, _SERIALIZERS[fmt](opportunity)))
+            results[fmt] = out_path
+        return results
+
+    def close(self) -> None:
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        if self._error is not None:
+            raise self._error
+
+    def _drain(self) -> None:
+        while (item := self._queue.get()) is not None:
+            out_path, data = item
+            if self._error is not None:
+                continue
+            try:
+                _atomic_write(out_path, data)
+            except Exception as exc:
+                self._error = exc
+                continue
+            logger.info("%s exported to %s", out_path.suffix[1:].upper(), out_path)
+
+
+def _write_csv_chunks(f, opportunities: Iterable[FundingOpportunity], chunk_size: int) -> int:
+    writer = None
+    rows = 0
+    for chunk in _chunked(opportunities, chunk_size):
+        dicts = [opportunity.to_export_dict() for opportunity in chunk]
+        if writer is None:
+            writer = csv.DictWriter(f, fieldnames=_csv_fieldnames(dicts[0]), lineterminator="\n")
+            writer.writeheader()
+        writer.writerows(dicts)
+        f.flush()
+        rows += len(dicts)
+
+    if writer is None:
+        csv.writer(f, lineterminator="\n").writerow(CSV_COLUMN_ORDER)
+    return rows
+
+
+def _write_csv_chunks_pandas(
+    path: str,
+    opportunities: Iterable[FundingOpportunity],
+    chunk_size: int,
+) -> int:
+    import pandas as pd
+
+    fieldnames = None
+    rows = 0
+    for chunk in _chunked(opportunities, chunk_size):
+        dicts = [opportunity.to_export_dict() for opportunity in chunk]
+        if fieldnames is None:
+            fieldnames = _csv_fieldnames(dicts[0])
+        pd.DataFrame(dicts, columns=fieldnames).to_csv(
+            path, mode="a", header=(rows == 0), index=False,
+            encoding="utf-8", lineterminator="\n",
+        )
+        rows += len(dicts)
+
+    if fieldnames is None:
+        pd.DataFrame(columns=CSV_COLUMN_ORDER).to_csv(
+            path, index=False, encoding="utf-8", lineterminator="\n",
+        )
+    return rows
+
+
+def export_csv_many(
+    opportunities: Iterable[FundingOpportunity],
+    out_dir: str | Path,
+    chunk_size: int = 10_000,
+    engine: str = "csv",
+) -> Path:
+    """Stream many opportunities into one CSV, ``chunk_size`` rows at a time.
+
+    ``opportunities`` may be any iterable (e.g. a generator), so peak
+    memory is one chunk of rows. ``engine="pandas"`` appends each chunk
+    with ``DataFrame.to_csv`` instead of the stdlib ``csv`` writer.
+    """
+    if engine not in ("csv", "pandas"):
+        raise ValueError(f"Unknown CSV engine: {engine}")
+
+    out_path = ensure_output_dir(out_dir) / "foa.csv"
+
+    # Rows are streamed straight to disk, so a failed export must not
+    # leave a large partial temp file behind.
+    tmp_path = _tmp_path(out_path)
+    tmp_path.unlink(missing_ok=True)
     try:
-        os.close(fd)
-        df.to_csv(tmp_path, index=False, encoding="utf-8")
-        os.replace(tmp_path, str(out_path))
+        if engine == "pandas":
+            rows = _write_csv_chunks_pandas(str(tmp_path), opportunities, chunk_size)
+        else:
+            with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+                rows = _write_csv_chunks(f, opportunities, chunk_size)
+        os.replace(tmp_path, out_path)
     except Exception:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+        tmp_path.unlink(missing_ok=True)
         raise
 
-    logger.info("CSV exported to %s", out_path)
+    logger.info("CSV exported to %s (%d rows)", out_path, rows)
     return out_path
 
 
@@ -82,3 +250,29 @@ def export_all(
         results["csv"] = export_csv(opportunity, out_dir)
 
     return results
+
+
+def _export_one(job: tuple[FundingOpportunity, str | Path, list[str] | None]) -> dict[str, Path]:
+    opportunity, out_dir, formats = job
+    return export_all(opportunity, out_dir, formats=formats)
+
+
+def export_many(
+    jobs: list[tuple[FundingOpportunity, str | Path]],
+    formats: list[str] | None = None,
+) -> list[dict[str, Path]]:
+    """Export each ``(opportunity, out_dir)`` pair, in input order.
+
+    Small batches go through one ``Exporter``, so encoding overlaps with
+    the file writes; large batches are fanned out over a process pool.
+    """
+    if len(jobs) < EXPORT_POOL_THRESHOLD:
+        with Exporter(formats) as exporter:
+            return [exporter.submit(opportunity, out_dir) for opportunity, out_dir in jobs]
+
+    tasks = [(opportunity, out_dir, formats) for opportunity, out_dir in jobs]
+
+    workers = min(os.cpu_count() or 1, len(tasks))
+    logger.info("Exporting %d opportunities with %d workers", len(tasks), workers)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_POOL_CONTEXT) as pool:
+        return list(pool.map(_export_one, tasks, chunksize=4))
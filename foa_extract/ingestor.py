@@ -1,15 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import email.utils
+import json
 import logging
+import multiprocessing
+import os
+import random
 import re
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
 from typing import Optional
 from urllib.parse import urlparse
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
 
+from foa_extract.cache import INGEST_TTL, RENDER_TTL, get_cache, refresh_requested
 from foa_extract.models import FundingOpportunity
 
 logger = logging.getLogger(__name__)
@@ -26,23 +41,98 @@ DEFAULT_HEADERS = {
 
 MAX_RETRIES = 3
 BACKOFF_FACTOR = 1.5
+# Upper bound (seconds) for any single retry wait, including Retry-After
+MAX_BACKOFF = 60
+# Statuses worth retrying; other HTTP errors fail immediately
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
 
 # Selenium page-load timeout (seconds)
 SELENIUM_WAIT = 15
 
+# Idle headless-Chrome instances kept for reuse
+DRIVER_POOL_SIZE = 2
 
-def fetch_with_retry(url: str, headers: dict | None = None, timeout: int = 30) -> requests.Response:
-    headers = headers or DEFAULT_HEADERS.copy()
+# Subresources Chrome never needs to fetch: only the DOM text is scraped
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.woff*", "*.css",
+    "*analytics*", "*doubleclick*",
+]
+
+# Backing JSON endpoint of the Grants.gov SPA
+GRANTS_API_URL = "https://www.grants.gov/grantsws/rest/opportunity/details?oppId={opp_id}"
+
+# Batch ingestion connection limits
+BATCH_CONCURRENCY = 64
+BATCH_PER_HOST = 8
+# Batches at least this large are parsed in a process pool
+PARSE_POOL_THRESHOLD = 8
+
+# Parse workers start after fallback threads, Selenium drivers and the HTTP
+# client may already hold locks, so never fork them from this process
+_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+# Shared keep-alive client so retries and repeat hosts reuse connections
+_SESSION = httpx.Client(
+    http2=True,
+    timeout=30,
+    headers=DEFAULT_HEADERS,
+    follow_redirects=True,
+    limits=httpx.Limits(max_keepalive_connections=32),
+)
+atexit.register(_SESSION.close)
+
+
+def _is_retryable(exc: httpx.HTTPError) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS
+    return True
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_delay(attempt: int, exc: httpx.HTTPError) -> float:
+    """Server-requested delay if given, else jittered exponential backoff."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        retry_after = _parse_retry_after(exc.response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return min(MAX_BACKOFF, retry_after)
+    return min(MAX_BACKOFF, BACKOFF_FACTOR ** attempt) * (0.5 + random.random())
+
+
+def fetch_with_retry(url: str, headers: dict | None = None, timeout: int = 30) -> httpx.Response:
     last_exception = None
 
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = _SESSION.get(url, headers=headers, timeout=timeout)
             response.raise_for_status()
             return response
-        except requests.RequestException as exc:
+        except httpx.InvalidURL as exc:
+            # Not an HTTPError; a malformed URL is bad input, not a network failure
+            raise ValueError(f"Invalid URL {url!r}: {exc}") from exc
+        except httpx.HTTPError as exc:
+            if not _is_retryable(exc):
+                raise ConnectionError(f"Failed to fetch {url}: {exc}") from exc
             last_exception = exc
-            wait_time = BACKOFF_FACTOR ** attempt
+            wait_time = _retry_delay(attempt, exc)
             logger.warning(
                 "Request attempt %d/%d failed for %s: %s. Retrying in %.1fs...",
                 attempt + 1, MAX_RETRIES, url, exc, wait_time,
@@ -55,65 +145,392 @@ def fetch_with_retry(url: str, headers: dict | None = None, timeout: int = 30) -
     )
 
 
+async def _afetch(
+    client: httpx.AsyncClient,
+    url: str,
+    sem: asyncio.Semaphore | None = None,
+    headers: dict | None = None,
+) -> str:
+    """Async counterpart of ``fetch_with_retry`` returning the response body."""
+    last_exception = None
+
+    async with sem if sem is not None else nullcontext():
+        for attempt in range(MAX_RETRIES):
+            try:
+                response = await client.get(url, headers=headers)
+                response.raise_for_status()
+                return response.text
+            except httpx.InvalidURL as exc:
+                raise ValueError(f"Invalid URL {url!r}: {exc}") from exc
+            except httpx.HTTPError as exc:
+                if not _is_retryable(exc):
+                    raise ConnectionError(f"Failed to fetch {url}: {exc}") from exc
+                last_exception = exc
+                wait_time = _retry_delay(attempt, exc)
+                logger.warning(
+                    "Request attempt %d/%d failed for %s: %s. Retrying in %.1fs...",
+                    attempt + 1, MAX_RETRIES, url, exc, wait_time,
+                )
+                if attempt < MAX_RETRIES - 1:
+                    await asyncio.sleep(wait_time)
+
+    raise ConnectionError(
+        f"Failed to fetch {url} after {MAX_RETRIES} attempts: {last_exception}"
+    )
+
+
+class _DriverPool:
+    """Keeps headless Chrome instances alive between renders.
+
+    Launching Chrome (and resolving the chromedriver binary) costs
+    seconds, so drivers are created lazily, handed out with ``acquire()``
+    and kept for reuse instead of being quit after every page. At most
+    ``max_idle`` drivers are out at once; further callers block until one
+    is released. Raises ``RuntimeError`` if Selenium / Chrome is unavailable.
+    """
+
+    def __init__(self, max_idle: int = DRIVER_POOL_SIZE) -> None:
+        self._max_idle = max_idle
+        self._idle: list = []
+        self._drivers: list = []
+        self._driver_path: str | None = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_idle)
+
+    def _launch(self):
+        try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            from selenium.webdriver.chrome.service import Service
+            from webdriver_manager.chrome import ChromeDriverManager
+        except ImportError as exc:
+            raise RuntimeError(
+                "Selenium or webdriver-manager is not installed. "
+                "Install with: pip install selenium webdriver-manager"
+            ) from exc
+
+        options = Options()
+        options.add_argument("--headless")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--window-size=1920,1080")
+        # Suppress noisy logging
+        options.add_argument("--log-level=3")
+        options.add_experimental_option("excludeSwitches", ["enable-logging"])
+        # Return once the DOM is ready; the explicit wait covers the SPA data
+        options.page_load_strategy = "eager"
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2},
+        )
+
+        with self._lock:
+            if self._driver_path is None:
+                self._driver_path = ChromeDriverManager().install()
+            driver_path = self._driver_path
+
+        logger.info("Launching headless Chrome")
+        driver = webdriver.Chrome(service=Service(driver_path), options=options)
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as exc:
+            logger.debug("Could not block subresources via CDP: %s", exc)
+        return driver
+
+    def get(self):
+        self._slots.acquire()
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+
+        try:
+            driver = self._launch()
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._drivers.append(driver)
+        return driver
+
+    def release(self, driver, reusable: bool = True) -> None:
+        try:
+            with self._lock:
+                if reusable and len(self._idle) < self._max_idle:
+                    self._idle.append(driver)
+                    return
+                self._drivers.remove(driver)
+            driver.quit()
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def acquire(self):
+        driver = self.get()
+        reusable = False
+        try:
+            yield driver
+            reusable = True
+        finally:
+            self.release(driver, reusable=reusable)
+
+    def close(self) -> None:
+        with self._lock:
+            drivers, self._drivers, self._idle = self._drivers, [], []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+driver_pool = _DriverPool()
+atexit.register(driver_pool.close)
+
+
 def render_with_selenium(url: str, wait_seconds: int = SELENIUM_WAIT) -> str:
-    """Use headless Chrome via Selenium to render a JS-heavy page.
+    """Use a pooled headless Chrome via Selenium to render a JS-heavy page.
 
-    Returns the fully rendered HTML string.
+    Returns the fully rendered HTML string, served from the disk cache
+    when the same URL was rendered within ``RENDER_TTL``. Renders whose
+    content wait timed out are returned but not cached.
     Raises ``RuntimeError`` if Selenium / Chrome is unavailable.
     """
+    cache = get_cache()
+    key = ("render", url)
+    if cache is not None and not refresh_requested():
+        html = cache.get(key)
+        if html is not None:
+            logger.info("Using cached render of %s", url)
+            return html
+
+    html, complete = _render_page(url, wait_seconds)
+    if cache is not None and complete:
+        cache.set(key, html, expire=RENDER_TTL)
+    return html
+
+
+def _render_page(url: str, wait_seconds: int) -> tuple[str, bool]:
+    """Render ``url``; the flag is ``False`` if the content wait timed out."""
     try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.chrome.service import Service
         from selenium.webdriver.common.by import By
         from selenium.webdriver.support import expected_conditions as EC
         from selenium.webdriver.support.ui import WebDriverWait
-        from webdriver_manager.chrome import ChromeDriverManager
     except ImportError as exc:
         raise RuntimeError(
             "Selenium or webdriver-manager is not installed. "
             "Install with: pip install selenium webdriver-manager"
         ) from exc
 
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
-    # Suppress noisy logging
-    options.add_argument("--log-level=3")
-    options.add_experimental_option("excludeSwitches", ["enable-logging"])
-
-    logger.info("Launching headless Chrome for %s", url)
-    driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
-        options=options,
-    )
-    try:
+    with driver_pool.acquire() as driver:
         driver.get(url)
         # Wait for the page's main content table to appear
+        complete = True
         try:
             WebDriverWait(driver, wait_seconds).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "table tr td"))
             )
         except Exception:
+            complete = False
             # Fallback: just wait a flat amount if the selector never appears
             logger.warning("Timed out waiting for table; using flat wait")
             time.sleep(wait_seconds)
 
         html = driver.page_source
         logger.info("Selenium rendered %d characters of HTML", len(html))
-        return html
-    finally:
-        driver.quit()
+        return html, complete
+
+
+GRANTS_FIELD_LABELS: dict[str, list[str]] = {
+    "title": [
+        "Funding Opportunity Title",
+        "Opportunity Title",
+        "Title",
+    ],
+    "agency": [
+        "Agency Name",
+        "Agency",
+        "Department",
+    ],
+    "opp_number": [
+        "Funding Opportunity Number",
+        "Opportunity Number",
+    ],
+    "open_date": [
+        "Posted Date",
+        "Open Date",
+        "Post Date",
+    ],
+    "close_date": [
+        "Current Closing Date for Applications",
+        "Close Date",
+        "Closing Date",
+        "Original Closing Date for Applications",
+        "Application Deadline",
+    ],
+    "eligibility": [
+        "Eligible Applicants",
+        "Eligibility",
+    ],
+    "description": [
+        "Description",
+        "Synopsis",
+        "Opportunity Description",
+    ],
+    "award_ceiling": [
+        "Award Ceiling",
+        "Estimated Total Program Funding",
+    ],
+    "award_floor": ["Award Floor"],
+    "expected_awards": ["Expected Number of Awards"],
+}
+
+NSF_FIELD_LABELS: dict[str, list[str]] = {
+    "title": ["Title", "Award Title"],
+    "abstract": ["Abstract", "Synopsis", "Program Synopsis"],
+    "start_date": ["Start Date", "Effective Date", "Award Effective Date"],
+    "end_date": ["End Date", "Expiration Date", "Award Expiration Date"],
+    "eligibility": ["Eligible", "Eligibility", "Who May Submit"],
+    "award_amount": ["Award Amount", "Awarded Amount", "Estimated Total"],
+}
+
+# First value-bearing element after a label, in document order
+_NEXT_VALUE_XPATH = etree.XPath(
+    "(descendant::* | following::*)"
+    "[self::td or self::dd or self::span or self::div or self::p][1]"
+)
+_NEXT_TD_XPATH = etree.XPath("following-sibling::td[1]")
+_META_XPATH = etree.XPath("//meta[@name][@content]")
+_DIV_WITH_ID_XPATH = etree.XPath("//div[@id]")
+_SYNOPSIS_ID_RE = re.compile(r"synopsis|description", re.I)
+
+
+def _parse_document(html: str) -> HtmlElement:
+    try:
+        try:
+            return lxml.html.document_fromstring(html)
+        except ValueError:
+            # lxml rejects str input that carries an XML encoding declaration
+            return lxml.html.document_fromstring(html.encode("utf-8"))
+    except etree.ParserError:
+        # Empty, whitespace- or comment-only bodies: treat as a blank page so
+        # every field falls back to its default, as BeautifulSoup did
+        return lxml.html.document_fromstring("<html></html>")
+
+
+def _element_string(element: HtmlElement) -> str | None:
+    """Text of an element with a single text child, like bs4's ``Tag.string``."""
+    while len(element):
+        if len(element) > 1 or element.text or element[0].tail:
+            return None
+        element = element[0]
+    return element.text
+
+
+class _LabelIndex:
+    """Label elements of one page, keyed by the label they contain."""
+
+    def __init__(self) -> None:
+        # First label-tag element whose text contains the label
+        self.headers: dict[str, HtmlElement] = {}
+        # ``td`` elements whose text ends with the label (optional ``:``)
+        self.cells: dict[str, list[HtmlElement]] = {}
+        # ``meta`` elements whose name contains the label
+        self.metas: dict[str, HtmlElement] = {}
+
+
+class _LabelMatcher:
+    """Precompiled label patterns for a set of fields.
+
+    ``scan`` walks the DOM once with a single alternation regex instead of
+    compiling and searching per label, and buckets the hits per label.
+    """
+
+    def __init__(
+        self,
+        field_labels: dict[str, list[str]],
+        label_tags: list[str],
+        with_meta: bool = False,
+    ) -> None:
+        labels = list(dict.fromkeys(
+            label for group in field_labels.values() for label in group
+        ))
+        self.label_tags = set(label_tags)
+        self.with_meta = with_meta
+        self._candidates = etree.XPath(
+            " | ".join(f"//{tag}" for tag in [*label_tags, "td"])
+        )
+        self._lowered = {label: label.lower() for label in labels}
+        self._cell_res = {
+            label: re.compile(re.escape(label) + r"\s*:?\s*$", re.I) for label in labels
+        }
+        self._any_re = re.compile(
+            "|".join(re.escape(label) for label in sorted(labels, key=len, reverse=True)),
+            re.I,
+        )
+
+    def _labels_in(self, text: str) -> list[str]:
+        lowered = text.lower()
+        return [label for label, low in self._lowered.items() if low in lowered]
+
+    def scan(self, tree: HtmlElement) -> _LabelIndex:
+        index = _LabelIndex()
+
+        for element in self._candidates(tree):
+            text = _element_string(element)
+            if not text or not self._any_re.search(text):
+                continue
+            for label in self._labels_in(text):
+                if element.tag in self.label_tags:
+                    index.headers.setdefault(label, element)
+                if element.tag == "td" and self._cell_res[label].search(text):
+                    index.cells.setdefault(label, []).append(element)
+
+        if self.with_meta:
+            for meta in _META_XPATH(tree):
+                for label in self._labels_in(meta.get("name")):
+                    index.metas.setdefault(label, meta)
+
+        return index
+
+
+_GRANTS_LABELS = _LabelMatcher(
+    GRANTS_FIELD_LABELS,
+    ["th", "dt", "label", "strong", "b", "span"],
+    with_meta=True,
+)
+_NSF_LABELS = _LabelMatcher(
+    NSF_FIELD_LABELS,
+    ["th", "dt", "label", "strong", "b", "span", "div"],
+)
 
 
 class BaseIngestor(ABC):
+    # Pages need JS rendering, so batches use extract() (Selenium first)
+    # instead of parsing the static batch_url body
+    needs_browser = False
+
     @abstractmethod
     def extract(self, url: str) -> FundingOpportunity:
         ...
 
+    @abstractmethod
+    def parse(self, body: str, url: str) -> FundingOpportunity:
+        """Build an opportunity from the already-fetched ``batch_url`` body."""
+        ...
+
+    def batch_url(self, url: str) -> str:
+        """URL to fetch for ``url`` when ingesting without a browser."""
+        return url
+
+    def batch_headers(self) -> dict | None:
+        """Extra request headers for ``batch_url``."""
+        return None
+
+    def extract_fallback(self, url: str) -> FundingOpportunity:
+        """``extract`` without the stages a failed ``batch_url`` fetch covered."""
+        return self.extract(url)
+
     @staticmethod
     def clean_text(text: str | None) -> str:
         if not text:
@@ -127,7 +544,18 @@ class GrantsGovIngestor(BaseIngestor):
     def extract(self, url: str) -> FundingOpportunity:
         opp_id = self._extract_opportunity_id(url)
 
-        # Primary path: render with Selenium (JS SPA)
+        # Primary path: the JSON API backing the SPA
+        try:
+            return self._extract_via_api(url, opp_id)
+        except (ConnectionError, ValueError) as api_err:
+            logger.warning("Grants.gov API failed (%s), falling back to Selenium", api_err)
+
+        return self.extract_fallback(url)
+
+    def extract_fallback(self, url: str) -> FundingOpportunity:
+        opp_id = self._extract_opportunity_id(url)
+
+        # Secondary path: render with Selenium (JS SPA)
         try:
             html = render_with_selenium(url)
             return self._parse_html(html, url, opp_id)
@@ -136,9 +564,23 @@ class GrantsGovIngestor(BaseIngestor):
         except Exception as sel_err:
             logger.warning("Selenium rendering failed (%s), falling back to static HTML", sel_err)
 
-        # Fallback: plain requests (works if page is server-rendered)
+        # Fallback: plain HTTP GET (works if page is server-rendered)
         return self._extract_via_static_html(url, opp_id)
 
+    def parse(self, body: str, url: str) -> FundingOpportunity:
+        opp_id = self._extract_opportunity_id(url)
+        # batch_url is the JSON API, so anything else (e.g. a maintenance
+        # page served with 200) is an API failure, not the opportunity page
+        if not body.lstrip().startswith("{"):
+            raise ValueError(f"Non-JSON API response for {opp_id}")
+        return self._parse_api(json.loads(body), url, opp_id)
+
+    def batch_url(self, url: str) -> str:
+        return GRANTS_API_URL.format(opp_id=self._extract_opportunity_id(url))
+
+    def batch_headers(self) -> dict | None:
+        return {"Accept": "application/json"}
+
     def _extract_opportunity_id(self, url: str) -> str:
         match = re.search(r"/(\d+)(?:\?|$|#)", url)
         if match:
@@ -155,84 +597,89 @@ class GrantsGovIngestor(BaseIngestor):
 
         raise ValueError(f"Cannot extract opportunity ID from URL: {url}")
 
+    def _extract_via_api(self, url: str, opp_id: str) -> FundingOpportunity:
+        headers = {**DEFAULT_HEADERS, "Accept": "application/json"}
+        response = fetch_with_retry(GRANTS_API_URL.format(opp_id=opp_id), headers=headers)
+        return self._parse_api(response.json(), url, opp_id)
+
+    def _parse_api(self, data: dict, url: str, opp_id: str) -> FundingOpportunity:
+        """Map an ``opportunity/details`` JSON payload onto the model."""
+        if not data.get("opportunityTitle"):
+            raise ValueError(f"No opportunity data in API response for {opp_id}")
+
+        synopsis = data.get("synopsis") or {}
+        eligibility = "; ".join(
+            applicant["description"]
+            for applicant in synopsis.get("applicantTypes") or []
+            if applicant.get("description")
+        )
+
+        return FundingOpportunity(
+            foa_id=data.get("opportunityNumber") or opp_id,
+            title=data["opportunityTitle"],
+            agency=synopsis.get("agencyName") or data.get("owningAgencyCode") or "",
+            open_date=synopsis.get("postingDate"),
+            close_date=synopsis.get("responseDate"),
+            eligibility=self.clean_text(eligibility),
+            description=self._html_to_text(synopsis.get("synopsisDesc")),
+            source_url=url,
+            award_ceiling=self._as_text(synopsis.get("awardCeiling")),
+            award_floor=self._as_text(synopsis.get("awardFloor")),
+            expected_awards=self._as_text(synopsis.get("numberOfAwards")),
+        )
+
+    @staticmethod
+    def _as_text(value: object) -> str | None:
+        if value is None or value == "":
+            return None
+        return str(value)
+
+    def _html_to_text(self, fragment: str | None) -> str:
+        if not fragment:
+            return ""
+        root = lxml.html.fragment_fromstring(fragment, create_parent="div")
+        return self.clean_text(" ".join(root.itertext()))
+
     def _extract_via_static_html(self, url: str, opp_id: str) -> FundingOpportunity:
-        """Fallback: fetch raw HTML with requests (no JS rendering)."""
+        """Fallback: fetch raw HTML over HTTP (no JS rendering)."""
         response = fetch_with_retry(url)
         return self._parse_html(response.text, url, opp_id)
 
     def _parse_html(self, html: str, url: str, opp_id: str) -> FundingOpportunity:
         """Parse opportunity data from HTML (rendered or static)."""
-        soup = BeautifulSoup(html, "lxml")
-
-        title = (
-            self._find_field(soup, [
-                "Funding Opportunity Title",
-                "Opportunity Title",
-                "Title",
-            ])
-            or self._get_page_title(soup)
-        )
-        agency = self._find_field(soup, [
-            "Agency Name",
-            "Agency",
-            "Department",
-        ])
-        opp_number = (
-            self._find_field(soup, [
-                "Funding Opportunity Number",
-                "Opportunity Number",
-            ])
-            or opp_id
-        )
-        open_date = self._find_field(soup, [
-            "Posted Date",
-            "Open Date",
-            "Post Date",
-        ])
-        close_date = self._find_field(soup, [
-            "Current Closing Date for Applications",
-            "Close Date",
-            "Closing Date",
-            "Original Closing Date for Applications",
-            "Application Deadline",
-        ])
-        eligibility = self._find_field(soup, [
-            "Eligible Applicants",
-            "Eligibility",
-        ])
-        description = self._find_field(soup, [
-            "Description",
-            "Synopsis",
-            "Opportunity Description",
-        ])
-        award_ceiling = self._find_field(soup, [
-            "Award Ceiling",
-            "Estimated Total Program Funding",
-        ])
-        award_floor = self._find_field(soup, ["Award Floor"])
-        expected_awards = self._find_field(soup, ["Expected Number of Awards"])
+        tree = _parse_document(html)
+        index = _GRANTS_LABELS.scan(tree)
+        fields = {
+            name: self._find_field(index, labels)
+            for name, labels in GRANTS_FIELD_LABELS.items()
+        }
+
+        title = fields["title"] or self._get_page_title(tree)
+        opp_number = fields["opp_number"] or opp_id
+        description = fields["description"]
 
         # Fallback: look for a synopsis/description div
         if not description:
-            synopsis_div = soup.find("div", {"id": re.compile(r"synopsis|description", re.I)})
-            if synopsis_div:
-                description = self.clean_text(synopsis_div.get_text())
+            for div in _DIV_WITH_ID_XPATH(tree):
+                if _SYNOPSIS_ID_RE.search(div.get("id")):
+                    description = self.clean_text(div.text_content())
+                    break
 
         return FundingOpportunity(
             foa_id=opp_number,
             title=title or "Unknown",
-            agency=agency or "",
-            open_date=open_date,
-            close_date=close_date,
-            eligibility=eligibility or "",
+            agency=fields["agency"] or "",
+            open_date=fields["open_date"],
+            close_date=fields["close_date"],
+            eligibility=fields["eligibility"] or "",
             description=self.clean_text(description),
             source_url=url,
-            award_ceiling=award_ceiling,
-            award_floor=award_floor,
-            expected_awards=expected_awards,
+            award_ceiling=fields["award_ceiling"],
+            award_floor=fields["award_floor"],
+            expected_awards=fields["expected_awards"],
         )
 
-    def _find_field(self, soup: BeautifulSoup, labels: list[str]) -> str | None:
+    def _find_field(self, index: _LabelIndex, labels: list[str]) -> str | None:
         """Find a field value by matching label text.
 
         Handles two common patterns:
@@ -243,53 +690,50 @@ class GrantsGovIngestor(BaseIngestor):
         """
         for label in labels:
             # --- Pattern 1: th/dt/label/strong/b/span -> sibling value ---
-            th = soup.find(
-                ["th", "dt", "label", "strong", "b", "span"],
-                string=re.compile(re.escape(label), re.I),
-            )
-            if th:
-                sibling = th.find_next(["td", "dd", "span", "div", "p"])
+            th = index.headers.get(label)
+            if th is not None:
+                sibling = _NEXT_VALUE_XPATH(th)
                 if sibling:
-                    text = self.clean_text(sibling.get_text())
+                    text = self.clean_text(sibling[0].text_content())
                     if text and text.lower() != label.lower():
                         return text
 
             # --- Pattern 2: td label -> next td value (Grants.gov SPA) ---
-            label_re = re.compile(re.escape(label) + r"\s*:?\s*$", re.I)
-            for td in soup.find_all("td", string=label_re):
-                next_td = td.find_next_sibling("td")
+            for td in index.cells.get(label, []):
+                next_td = _NEXT_TD_XPATH(td)
                 if next_td:
-                    text = self.clean_text(next_td.get_text())
+                    text = self.clean_text(next_td[0].text_content())
                     if text:
                         return text
 
             # --- Pattern 3: meta tag ---
-            meta = soup.find("meta", {"name": re.compile(re.escape(label), re.I)})
-            if meta and meta.get("content"):
-                return self.clean_text(meta["content"])
+            meta = index.metas.get(label)
+            if meta is not None and meta.get("content"):
+                return self.clean_text(meta.get("content"))
 
         return None
 
     @staticmethod
-    def _get_page_title(soup: BeautifulSoup) -> str:
+    def _get_page_title(tree: HtmlElement) -> str:
         # Skip generic page titles like "Grants.gov" or "Search Results Detail"
-        title_tag = soup.find("title")
-        if title_tag:
-            text = title_tag.get_text().strip()
+        title_tag = tree.find(".//title")
+        if title_tag is not None:
+            text = title_tag.text_content().strip()
             # Only use if it looks like an actual opportunity title
             skip = ["grants.gov", "search results", "view grant", "lock"]
             if text and not any(s in text.lower() for s in skip):
                 return text
 
-        h1 = soup.find("h1")
-        if h1:
-            text = h1.get_text().strip()
+        h1 = tree.find(".//h1")
+        if h1 is not None:
+            text = h1.text_content().strip()
             if text and "view grant" not in text.lower():
                 return text
         return "Unknown"
 
 
 class NSFIngestor(BaseIngestor):
+    needs_browser = True
 
     def extract(self, url: str) -> FundingOpportunity:
         # Try Selenium first for JS-rendered pages
@@ -303,35 +747,39 @@ class NSFIngestor(BaseIngestor):
             response = fetch_with_retry(url)
             html = response.text
 
-        soup = BeautifulSoup(html, "lxml")
+        return self.parse(html, url)
+
+    def parse(self, body: str, url: str) -> FundingOpportunity:
+        tree = _parse_document(body)
+        index = _NSF_LABELS.scan(tree)
+        fields = {
+            name: self._find_nsf_field(index, labels)
+            for name, labels in NSF_FIELD_LABELS.items()
+        }
 
         award_id = self._extract_award_id(url)
-        title = self._find_nsf_field(soup, ["Title", "Award Title"]) or self._get_page_title(soup)
+        title = fields["title"] or self._get_page_title(tree)
         agency = "National Science Foundation"
-        abstract = self._find_nsf_field(soup, ["Abstract", "Synopsis", "Program Synopsis"])
-        start_date = self._find_nsf_field(soup, ["Start Date", "Effective Date", "Award Effective Date"])
-        end_date = self._find_nsf_field(soup, ["End Date", "Expiration Date", "Award Expiration Date"])
-        eligibility = self._find_nsf_field(soup, ["Eligible", "Eligibility", "Who May Submit"])
-        award_amount = self._find_nsf_field(soup, ["Award Amount", "Awarded Amount", "Estimated Total"])
+        abstract = fields["abstract"]
 
         if not abstract:
-            for div in soup.find_all("div"):
+            for div in tree.iter("div"):
                 div_id = div.get("id", "")
-                div_class = " ".join(div.get("class", []))
+                div_class = div.get("class", "")
                 if any(keyword in (div_id + div_class).lower() for keyword in ["abstract", "synopsis", "description"]):
-                    abstract = self.clean_text(div.get_text())
+                    abstract = self.clean_text(div.text_content())
                     break
 
         return FundingOpportunity(
             foa_id=award_id or "NSF-UNKNOWN",
             title=title or "Unknown",
             agency=agency,
-            open_date=start_date,
-            close_date=end_date,
-            eligibility=eligibility or "",
+            open_date=fields["start_date"],
+            close_date=fields["end_date"],
+            eligibility=fields["eligibility"] or "",
             description=self.clean_text(abstract),
             source_url=url,
-            award_ceiling=award_amount,
+            award_ceiling=fields["award_amount"],
         )
 
     def _extract_award_id(self, url: str) -> str:
@@ -345,59 +793,66 @@ class NSFIngestor(BaseIngestor):
 
         return ""
 
-    def _find_nsf_field(self, soup: BeautifulSoup, labels: list[str]) -> str | None:
+    def _find_nsf_field(self, index: _LabelIndex, labels: list[str]) -> str | None:
         for label in labels:
-            element = soup.find(
-                ["th", "dt", "label", "strong", "b", "span", "div"],
-                string=re.compile(re.escape(label), re.I),
-            )
-            if element:
-                sibling = element.find_next(["td", "dd", "span", "div", "p"])
+            element = index.headers.get(label)
+            if element is not None:
+                sibling = _NEXT_VALUE_XPATH(element)
                 if sibling:
-                    text = self.clean_text(sibling.get_text())
+                    text = self.clean_text(sibling[0].text_content())
                     if text and text.lower() != label.lower():
                         return text
 
             # td-td pattern
-            label_re = re.compile(re.escape(label) + r"\s*:?\s*$", re.I)
-            for td in soup.find_all("td", string=label_re):
-                next_td = td.find_next_sibling("td")
+            for td in index.cells.get(label, []):
+                next_td = _NEXT_TD_XPATH(td)
                 if next_td:
-                    text = self.clean_text(next_td.get_text())
+                    text = self.clean_text(next_td[0].text_content())
                     if text:
                         return text
         return None
 
     @staticmethod
-    def _get_page_title(soup: BeautifulSoup) -> str:
-        h1 = soup.find("h1")
-        if h1:
-            return h1.get_text().strip()
-        title = soup.find("title")
-        if title:
-            return title.get_text().strip()
+    def _get_page_title(tree: HtmlElement) -> str:
+        h1 = tree.find(".//h1")
+        if h1 is not None:
+            return h1.text_content().strip()
+        title = tree.find(".//title")
+        if title is not None:
+            return title.text_content().strip()
         return "Unknown"
 
 
 class IngestorFactory:
+    # Keyed by reversed domain labels ("grants.gov" -> "gov.grants") so a
+    # hostname is resolved by exact suffix match, one dict lookup per label.
     _registry: dict[str, type[BaseIngestor]] = {}
 
+    @staticmethod
+    def _registry_key(domain: str) -> str:
+        return ".".join(reversed(domain.lower().strip(".").split(".")))
+
     @classmethod
     def register(cls, domain_pattern: str, ingestor_cls: type[BaseIngestor]) -> None:
-        cls._registry[domain_pattern] = ingestor_cls
+        cls._registry[cls._registry_key(domain_pattern)] = ingestor_cls
 
     @classmethod
     def get_ingestor(cls, url: str) -> BaseIngestor:
         parsed = urlparse(url)
-        hostname = parsed.hostname or ""
-
-        for pattern, ingestor_cls in cls._registry.items():
-            if pattern in hostname:
+        # A fully qualified name ("www.grants.gov.") has a trailing dot
+        hostname = (parsed.hostname or "").rstrip(".").lower()
+
+        # Most specific registered suffix wins
+        labels = hostname.split(".")[::-1]
+        for depth in range(len(labels), 0, -1):
+            ingestor_cls = cls._registry.get(".".join(labels[:depth]))
+            if ingestor_cls is not None:
                 return ingestor_cls()
 
+        supported = (cls._registry_key(key) for key in cls._registry)
         raise ValueError(
             f"No ingestor registered for domain: {hostname}. "
-            f"Supported domains: {', '.join(cls._registry.keys())}"
+            f"Supported domains: {', '.join(supported)}"
         )
 
 
@@ -405,7 +860,209 @@ IngestorFactory.register("grants.gov", GrantsGovIngestor)
 IngestorFactory.register("nsf.gov", NSFIngestor)
 
 
+def _validator(response: httpx.Response) -> str | None:
+    return response.headers.get("ETag") or response.headers.get("Last-Modified")
+
+
+def _head_validator(url: str) -> str | None:
+    """ETag or Last-Modified for ``url``, or ``None`` if it is not available."""
+    try:
+        response = _SESSION.head(url, timeout=10, follow_redirects=True)
+        response.raise_for_status()
+    except Exception as exc:
+        # Any failure just means the result is fetched normally
+        logger.debug("HEAD %s failed: %s", url, exc)
+        return None
+    return _validator(response)
+
+
+async def _ahead_validator(client: httpx.AsyncClient, url: str) -> str | None:
+    try:
+        response = await client.head(url, timeout=10)
+        response.raise_for_status()
+    except Exception as exc:
+        logger.debug("HEAD %s failed: %s", url, exc)
+        return None
+    return _validator(response)
+
+
+def _cached_entry(url: str) -> dict | None:
+    cache = get_cache()
+    if cache is None or refresh_requested():
+        return None
+    return cache.get(("ingest", url))
+
+
+def _fresh_opportunity(url: str, entry: dict | None) -> FundingOpportunity | None:
+    """The cached result if it was stored within ``INGEST_TTL``; no HEAD needed."""
+    if entry is None or time.time() - entry.get("stored_at", 0) >= INGEST_TTL:
+        return None
+    logger.info("Using cached result for %s", url)
+    return FundingOpportunity(**entry["data"])
+
+
+def _revalidated_opportunity(
+    url: str,
+    entry: dict | None,
+    validator: str | None,
+) -> FundingOpportunity | None:
+    """The cached result if its ETag/Last-Modified still matches."""
+    if entry is None or validator is None or entry["validator"] != validator:
+        return None
+    logger.info("Using cached result for %s (unchanged)", url)
+    _store_entry(url, validator, entry["data"])
+    return FundingOpportunity(**entry["data"])
+
+
+def _store_entry(url: str, validator: str | None, data: dict) -> None:
+    cache = get_cache()
+    if cache is not None and validator is not None:
+        cache.set(("ingest", url), {"validator": validator, "data": data, "stored_at": time.time()})
+
+
 def ingest(url: str) -> FundingOpportunity:
+    """Extract one opportunity.
+
+    A result cached within ``INGEST_TTL`` is returned as is. An older one
+    is reused if a HEAD request on the ingestor's ``batch_url`` returns the
+    ETag/Last-Modified stored with it; otherwise the page is extracted.
+    """
+    ingestor = IngestorFactory.get_ingestor(url)
+    logger.info("Using %s for URL: %s", type(ingestor).__name__, url)
+    if get_cache() is None:
+        return ingestor.extract(url)
+
+    entry = _cached_entry(url)
+    opportunity = _fresh_opportunity(url, entry)
+    if opportunity is not None:
+        return opportunity
+
+    validator = _head_validator(ingestor.batch_url(url))
+    opportunity = _revalidated_opportunity(url, entry, validator)
+    if opportunity is None:
+        opportunity = ingestor.extract(url)
+        _store_entry(url, validator, opportunity.model_dump())
+    return opportunity
+
+
+def make_async_client(max_connections: int = BATCH_CONCURRENCY) -> httpx.AsyncClient:
+    """HTTP/2 client for concurrent fetches; use it as ``async with``."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=30,
+        headers=DEFAULT_HEADERS,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=32,
+        ),
+    )
+
+
+async def ingest_async(
+    client: httpx.AsyncClient,
+    url: str,
+    sem: asyncio.Semaphore | None = None,
+    pool: ProcessPoolExecutor | None = None,
+) -> FundingOpportunity:
+    """Ingest one URL over a shared async client.
+
+    The ingestor's ``batch_url`` is fetched and parsed directly (in
+    ``pool`` if given), with ``sem`` bounding the requests in flight. If
+    that fails, ``extract_fallback`` runs the remaining stages in a worker
+    thread. Ingestors with ``needs_browser`` go straight to ``extract``.
+    Caching works as in ``ingest``.
+    """
     ingestor = IngestorFactory.get_ingestor(url)
     logger.info("Using %s for URL: %s", type(ingestor).__name__, url)
-    return ingestor.extract(url)
+    fetch_url = ingestor.batch_url(url)
+
+    validator = None
+    async with sem if sem is not None else nullcontext():
+        if get_cache() is not None:
+            entry = _cached_entry(url)
+            opportunity = _fresh_opportunity(url, entry)
+            if opportunity is not None:
+                return opportunity
+            validator = await _ahead_validator(client, fetch_url)
+            opportunity = _revalidated_opportunity(url, entry, validator)
+            if opportunity is not None:
+                return opportunity
+
+        if ingestor.needs_browser:
+            opportunity = None
+        else:
+            try:
+                body = await _afetch(client, fetch_url, headers=ingestor.batch_headers())
+                opportunity = await _parse_body(ingestor, body, url, pool)
+            except (ConnectionError, ValueError) as exc:
+                logger.warning("Direct fetch failed for %s (%s), falling back", url, exc)
+                opportunity = None
+
+    # Selenium work runs outside the semaphore; the driver pool bounds it
+    if opportunity is None:
+        extract = ingestor.extract if ingestor.needs_browser else ingestor.extract_fallback
+        opportunity = await asyncio.to_thread(extract, url)
+    _store_entry(url, validator, opportunity.model_dump())
+    return opportunity
+
+
+async def _parse_body(
+    ingestor: BaseIngestor,
+    body: str,
+    url: str,
+    pool: ProcessPoolExecutor | None,
+) -> FundingOpportunity:
+    if pool is None:
+        return ingestor.parse(body, url)
+    # Only the page body and URL go to the worker and a plain dict comes back
+    data = await asyncio.get_running_loop().run_in_executor(pool, _parse_job, (body, url))
+    return FundingOpportunity(**data)
+
+
+async def ingest_many(
+    urls: list[str],
+    return_exceptions: bool = False,
+) -> list[FundingOpportunity | BaseException]:
+    """Ingest many URLs concurrently with ``ingest_async``.
+
+    Requests share one HTTP/2 ``httpx.AsyncClient`` and are limited to
+    ``BATCH_PER_HOST`` per host; large batches are parsed in a process
+    pool. Results are returned in the order of ``urls``. With
+    ``return_exceptions``, a failed URL yields its exception instead of
+    aborting the batch.
+    """
+    host_sems: dict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(BATCH_PER_HOST)
+    )
+
+    # Parsing is CPU-bound, so large batches spread it over processes
+    pool = None
+    if len(urls) >= PARSE_POOL_THRESHOLD:
+        workers = min(os.cpu_count() or 1, len(urls))
+        logger.info("Parsing %d pages with %d workers", len(urls), workers)
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=_POOL_CONTEXT)
+
+    async def ingest_one(url: str) -> FundingOpportunity:
+        # Budget by the host actually fetched: batch_url may point elsewhere
+        # (every Grants.gov URL maps to the one API host)
+        ingestor = IngestorFactory.get_ingestor(url)
+        host = urlparse(ingestor.batch_url(url)).hostname or ""
+        return await ingest_async(client, url, host_sems[host], pool)
+
+    logger.info("Fetching %d URLs (%d per host)", len(urls), BATCH_PER_HOST)
+    with pool if pool is not None else nullcontext():
+        async with make_async_client() as client:
+            return await asyncio.gather(
+                *(ingest_one(url) for url in urls),
+                return_exceptions=return_exceptions,
+            )
+
+
+def _parse_job(job: tuple[str, str]) -> dict:
+    body, url = job
+    return IngestorFactory.get_ingestor(url).parse(body, url).model_dump()
+
+
+def ingest_many_sync(urls: list[str]) -> list[FundingOpportunity]:
+    return asyncio.run(ingest_many(urls))
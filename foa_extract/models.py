@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import functools
 import re
 from datetime import date
 from typing import Optional
 
 from pydantic import BaseModel, field_validator, model_validator
 
+try:
+    from dateutil import parser as dateutil_parser
+except ImportError:
+    dateutil_parser = None
+
 
 class FundingOpportunity(BaseModel):
     foa_id: str
@@ -49,7 +55,16 @@ class FundingOpportunity(BaseModel):
         return data
 
 
-_ISO_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+# ISO, M/D/YYYY, "Month D, YYYY" and "D Month YYYY" in one pass.
+# Only the ISO form must span the whole string.
+_DATE_PATTERN = re.compile(
+    r"^(?:"
+    r"(?P<iso>\d{4}-\d{2}-\d{2})$"
+    r"|(?P<m>\d{1,2})/(?P<d>\d{1,2})/(?P<y>\d{4})"
+    r"|(?P<mon>[A-Za-z]+)\s+(?P<d2>\d{1,2}),?\s+(?P<y2>\d{4})"
+    r"|(?P<d3>\d{1,2})\s+(?P<mon2>[A-Za-z]+)\s+(?P<y3>\d{4})"
+    r")"
+)
 
 _MONTH_MAP = {
     "jan": 1, "january": 1,
@@ -67,40 +82,33 @@ _MONTH_MAP = {
 }
 
 
+@functools.lru_cache(maxsize=2048)
 def format_date(raw: str) -> str | None:
     raw = raw.strip()
     if not raw:
         return None
 
-    if _ISO_PATTERN.match(raw):
-        return raw
-
-    slash_match = re.match(r"(\d{1,2})/(\d{1,2})/(\d{4})", raw)
-    if slash_match:
-        m, d, y = slash_match.groups()
-        return f"{y}-{int(m):02d}-{int(d):02d}"
+    match = _DATE_PATTERN.match(raw)
+    if match:
+        groups = match.groupdict()
+        if groups["iso"]:
+            return raw
 
-    text_match = re.match(
-        r"([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})", raw
-    )
-    if text_match:
-        month_str, day_str, year_str = text_match.groups()
-        month_num = _MONTH_MAP.get(month_str.lower())
-        if month_num:
-            return f"{year_str}-{month_num:02d}-{int(day_str):02d}"
+        if groups["y"]:
+            return f"{groups['y']}-{int(groups['m']):02d}-{int(groups['d']):02d}"
 
-    text_match_2 = re.match(
-        r"(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})", raw
-    )
-    if text_match_2:
-        day_str, month_str, year_str = text_match_2.groups()
+        if groups["y2"]:
+            month_str, day_str, year_str = groups["mon"], groups["d2"], groups["y2"]
+        else:
+            month_str, day_str, year_str = groups["mon2"], groups["d3"], groups["y3"]
         month_num = _MONTH_MAP.get(month_str.lower())
         if month_num:
             return f"{year_str}-{month_num:02d}-{int(day_str):02d}"
 
+    if dateutil_parser is None:
+        return None
     try:
-        from dateutil import parser as dateutil_parser
         parsed = dateutil_parser.parse(raw, fuzzy=True)
         return parsed.strftime("%Y-%m-%d")
-    except (ValueError, ImportError):
+    except ValueError:
         return None
@@ -1,9 +1,22 @@
 from __future__ import annotations
 
+import collections
+import functools
+import hashlib
+import importlib.metadata
 import logging
 import re
 from typing import Optional
 
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from foa_extract.cache import get_cache, refresh_requested
+
 logger = logging.getLogger(__name__)
 
 KEYWORD_TAG_MAP: dict[str, list[str]] = {
@@ -110,18 +123,176 @@ TFIDF_CATEGORY_DESCRIPTIONS = {
 }
 
 
+# Flat, index-aligned keyword tables: keyword i belongs to tag
+# _TAG_NAMES[_KW2TAG[i]]. Tag names are sorted so hits come out in order.
+_TAG_NAMES = sorted(KEYWORD_TAG_MAP)
+_KEYWORDS = [
+    keyword
+    for tag in _TAG_NAMES
+    for keyword in KEYWORD_TAG_MAP[tag]
+]
+_KW2TAG = np.fromiter(
+    (idx for idx, tag in enumerate(_TAG_NAMES) for _ in KEYWORD_TAG_MAP[tag]),
+    dtype=np.int32,
+    count=len(_KEYWORDS),
+)
+
+
+def _build_automaton():
+    automaton = ahocorasick.Automaton()
+    for kw_idx, keyword in enumerate(_KEYWORDS):
+        automaton.add_word(keyword, kw_idx)
+    automaton.make_automaton()
+    return automaton
+
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _build_token_tables() -> tuple[dict[str, list[int]], list[tuple[int, str, re.Pattern]]]:
+    single_word: dict[str, list[int]] = {}
+    phrases: list[tuple[int, str, re.Pattern]] = []
+    for keyword, tag_idx in zip(_KEYWORDS, _KW2TAG.tolist()):
+        if _TOKEN_RE.fullmatch(keyword):
+            single_word.setdefault(keyword, []).append(tag_idx)
+        else:
+            pattern = re.compile(r"\b" + re.escape(keyword) + r"\b")
+            phrases.append((tag_idx, keyword, pattern))
+    return single_word, phrases
+
+
+# All keywords are matched in one pass when pyahocorasick is available.
+# Otherwise single-word keywords are looked up in the text's token set
+# and only multi-word phrases fall back to a word-boundary regex.
+_AC = _build_automaton() if ahocorasick is not None else None
+_SINGLE_WORD_KW, _PHRASE_KW = _build_token_tables() if _AC is None else ({}, [])
+_WORD_CHAR_RE = re.compile(r"\w")
+
+
+def _at_boundaries(text: str, start: int, end: int) -> bool:
+    """Whether ``text[start:end]`` is delimited like ``\\b...\\b``.
+
+    Every keyword starts and ends with a word character, so both
+    neighbours must be non-word characters or the edge of the text.
+    """
+    return not (
+        (start > 0 and _WORD_CHAR_RE.match(text, start - 1))
+        or (end < len(text) and _WORD_CHAR_RE.match(text, end))
+    )
+
+
+# Tagging is a pure function of its text inputs, so results are memoized
+# (as tuples, so callers cannot mutate a cached value).
+TAG_CACHE_SIZE = 4096
+
+
 def tag_by_keywords(title: str, description: str) -> list[str]:
+    return list(_tag_by_keywords(title, description))
+
+
+@functools.lru_cache(maxsize=TAG_CACHE_SIZE)
+def _tag_by_keywords(title: str, description: str) -> tuple[str, ...]:
     combined = (title + " " + description).lower()
-    matched_tags = []
+    hit = np.zeros(len(_TAG_NAMES), dtype=bool)
+
+    if _AC is not None:
+        matched = [
+            kw_idx
+            for end, kw_idx in _AC.iter(combined)
+            if _at_boundaries(combined, end - len(_KEYWORDS[kw_idx]) + 1, end + 1)
+        ]
+        hit[_KW2TAG[matched]] = True
+    else:
+        tokens = set(_TOKEN_RE.findall(combined))
+        for token in tokens & _SINGLE_WORD_KW.keys():
+            hit[_SINGLE_WORD_KW[token]] = True
+        for tag_idx, phrase, pattern in _PHRASE_KW:
+            if not hit[tag_idx] and phrase in combined and pattern.search(combined):
+                hit[tag_idx] = True
+
+    return tuple(_TAG_NAMES[idx] for idx in np.flatnonzero(hit))
+
+
+_CATEGORIES = list(TFIDF_CATEGORY_DESCRIPTIONS.keys())
+
+
+# Vectorizer settings the TF-IDF scores (and the default threshold) were tuned with
+TFIDF_MAX_FEATURES = 5000
+
+
+@functools.lru_cache(maxsize=None)
+def _category_model():
+    """Precompute the category side of the TF-IDF fit, on first use.
 
-    for tag, keywords in KEYWORD_TAG_MAP.items():
-        for keyword in keywords:
-            pattern = r"\b" + re.escape(keyword) + r"\b"
-            if re.search(pattern, combined):
-                matched_tags.append(tag)
-                break
+    Each call scores the document as if ``TfidfVectorizer`` had been fit on
+    the category descriptions plus that document, but only the document's
+    own term counts are computed per call. Returns the analyzer, the sorted
+    category vocabulary, per-category term counts, and the category
+    document and term frequencies, or ``None`` if scikit-learn is missing.
+    scikit-learn is imported here because it takes about a second to import.
+    """
+    try:
+        from sklearn.feature_extraction.text import CountVectorizer
+    except ImportError:
+        return None
+
+    counter = CountVectorizer(stop_words="english", ngram_range=(1, 2))
+    counts = counter.fit_transform(list(TFIDF_CATEGORY_DESCRIPTIONS.values()))
+    vocabulary = counter.get_feature_names_out().tolist()
+    counts = counts.toarray().astype(np.float64)
+    doc_freq = (counts > 0).sum(axis=0)
+    term_freq = counts.sum(axis=0).astype(np.int64)
+    return counter.build_analyzer(), vocabulary, counts, doc_freq, term_freq
+
+
+def _tfidf_similarities(model, text: str) -> np.ndarray:
+    """Cosine scores of ``text`` against each category.
+
+    Reproduces ``TfidfVectorizer(stop_words="english", ngram_range=(1, 2),
+    max_features=TFIDF_MAX_FEATURES)`` fit on the descriptions plus
+    ``text``, relying on these scikit-learn details: the default smooth idf
+    ``ln((1 + n) / (1 + df)) + 1``, raw counts times idf with l2 row norms,
+    and ``CountVectorizer._limit_features`` keeping
+    ``(-totals).argsort()[:max_features]`` over the alphabetically sorted
+    vocabulary (which fixes the tie order). tests/test_tagger.py checks
+    the result against ``TfidfVectorizer`` itself.
+    """
+    analyzer, vocabulary, counts, doc_freq, term_freq = model
+    doc_counts = collections.Counter(analyzer(text))
+    doc_vec = np.array([doc_counts.pop(term, 0) for term in vocabulary], dtype=np.float64)
+    extra = doc_counts  # terms that appear only in the document
+
+    keep = np.ones(len(vocabulary), dtype=bool)
+    extra_counts = np.fromiter(extra.values(), dtype=np.float64, count=len(extra))
+    if len(vocabulary) + len(extra) > TFIDF_MAX_FEATURES:
+        # Same cut as CountVectorizer's max_features: the most frequent terms
+        # over the whole fit corpus, ranked in sorted-term order.
+        terms = sorted([*vocabulary, *extra])
+        position = {term: idx for idx, term in enumerate(terms)}
+        totals = np.zeros(len(terms), dtype=np.int64)
+        cat_pos = np.array([position[term] for term in vocabulary])
+        totals[cat_pos] = term_freq + doc_vec.astype(np.int64)
+        extra_pos = np.array([position[term] for term in extra], dtype=np.intp)
+        totals[extra_pos] = extra_counts.astype(np.int64)
+        kept = np.zeros(len(terms), dtype=bool)
+        kept[(-totals).argsort()[:TFIDF_MAX_FEATURES]] = True
+        keep = kept[cat_pos]
+        extra_counts = extra_counts[kept[extra_pos]]
+
+    # Smoothed idf over the categories plus the document
+    n_docs = len(counts) + 1
+    idf = np.log((1 + n_docs) / (1 + doc_freq + (doc_vec > 0))) + 1
+    idf[~keep] = 0.0
+    extra_idf = np.log((1 + n_docs) / 2) + 1
 
-    return sorted(set(matched_tags))
+    cat_weights = counts * idf
+    doc_weights = doc_vec * idf
+    cat_norms = np.linalg.norm(cat_weights, axis=1)
+    doc_norm = np.sqrt(doc_weights @ doc_weights + ((extra_counts * extra_idf) ** 2).sum())
+    if doc_norm == 0:
+        return np.zeros(len(counts))
+    cat_norms[cat_norms == 0] = 1.0
+    return (cat_weights @ doc_weights) / (cat_norms * doc_norm)
 
 
 def tag_by_tfidf(
@@ -129,40 +300,57 @@ def tag_by_tfidf(
     description: str,
     threshold: float = 0.08,
 ) -> list[str]:
-    try:
-        from sklearn.feature_extraction.text import TfidfVectorizer
-        from sklearn.metrics.pairwise import cosine_similarity
-    except ImportError:
+    return list(_tag_by_tfidf(title, description, threshold))
+
+
+@functools.lru_cache(maxsize=TAG_CACHE_SIZE)
+def _tag_by_tfidf(title: str, description: str, threshold: float) -> tuple[str, ...]:
+    model = _category_model()
+    if model is None:
         logger.warning("scikit-learn not installed; skipping TF-IDF tagging")
-        return []
+        return ()
 
     combined_text = f"{title} {description}"
     if len(combined_text.strip()) < 10:
-        return []
-
-    categories = list(TFIDF_CATEGORY_DESCRIPTIONS.keys())
-    corpus = list(TFIDF_CATEGORY_DESCRIPTIONS.values())
-    corpus.append(combined_text)
-
-    vectorizer = TfidfVectorizer(
-        stop_words="english",
-        max_features=5000,
-        ngram_range=(1, 2),
-    )
-    tfidf_matrix = vectorizer.fit_transform(corpus)
+        return ()
 
-    doc_vector = tfidf_matrix[-1]
-    category_vectors = tfidf_matrix[:-1]
-
-    similarities = cosine_similarity(doc_vector, category_vectors).flatten()
+    similarities = _tfidf_similarities(model, combined_text)
 
     matched = []
     for idx, score in enumerate(similarities):
         if score >= threshold:
-            matched.append((categories[idx], score))
+            matched.append((_CATEGORIES[idx], score))
 
     matched.sort(key=lambda x: x[1], reverse=True)
-    return [cat for cat, _ in matched]
+    return tuple(cat for cat, _ in matched)
+
+
+# Bump when the scoring itself changes without the tables changing
+_SCORING_VERSION = 2
+
+# Changes whenever the tag tables do, so stale persisted tags are never served
+_TABLES_DIGEST = hashlib.blake2b(
+    repr((_SCORING_VERSION, KEYWORD_TAG_MAP, TFIDF_CATEGORY_DESCRIPTIONS)).encode("utf-8"),
+    digest_size=8,
+).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _sklearn_version() -> str | None:
+    # Read from package metadata so a cache hit still skips importing sklearn
+    try:
+        return importlib.metadata.version("scikit-learn")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def _tags_key(title: str, description: str, tfidf_threshold: float) -> tuple:
+    digest = hashlib.blake2b(
+        title.encode("utf-8") + b"\0" + description.encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    # A scikit-learn upgrade may change the scores, so it starts a new key space
+    return ("tags", _TABLES_DIGEST, _sklearn_version(), digest, tfidf_threshold)
 
 
 def apply_tags(
@@ -171,12 +359,32 @@ def apply_tags(
     use_nlp: bool = True,
     tfidf_threshold: float = 0.08,
 ) -> list[str]:
-    keyword_tags = tag_by_keywords(title, description)
+    return list(_apply_tags(title, description, use_nlp, tfidf_threshold))
 
-    if use_nlp:
-        nlp_tags = tag_by_tfidf(title, description, threshold=tfidf_threshold)
-        all_tags = list(dict.fromkeys(keyword_tags + nlp_tags))
-    else:
-        all_tags = keyword_tags
 
-    return all_tags
+@functools.lru_cache(maxsize=TAG_CACHE_SIZE)
+def _apply_tags(
+    title: str,
+    description: str,
+    use_nlp: bool,
+    tfidf_threshold: float,
+) -> tuple[str, ...]:
+    if not use_nlp:
+        return _tag_by_keywords(title, description)
+
+    # NLP tags are also kept on disk: a hit in a fresh process skips the
+    # scikit-learn import and the category fit altogether.
+    cache = get_cache()
+    key = _tags_key(title, description, tfidf_threshold)
+    if cache is not None and not refresh_requested():
+        tags = cache.get(key)
+        if tags is not None:
+            return tags
+
+    keyword_tags = _tag_by_keywords(title, description)
+    nlp_tags = _tag_by_tfidf(title, description, tfidf_threshold)
+    tags = tuple(dict.fromkeys(keyword_tags + nlp_tags))
+    if cache is not None and _category_model() is not None:
+        cache.set(key, tags)
+    return tags
+
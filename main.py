@@ -1,33 +1,60 @@
 from __future__ import annotations
 
-import argparse
 import logging
+import re
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
-from foa_extract.exporter import export_all
-from foa_extract.ingestor import ingest
-from foa_extract.tagger import apply_tags
+# asyncio and the foa_extract modules (httpx, lxml, pydantic, numpy) are
+# imported inside the functions that use them, so --help and argument
+# errors return without paying for them.
+if TYPE_CHECKING:
+    import argparse
+
+    from foa_extract.models import FundingOpportunity
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("json", "csv", "all")
 
 
 def setup_logging(verbose: bool) -> None:
+    # The format never uses thread, process or task names, so skip
+    # collecting them for each record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    if hasattr(logging, "logAsyncioTasks"):  # Python 3.12+
+        logging.logAsyncioTasks = False
+
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=level,
         format="%(asctime)s [%(levelname)s] %(message)s",
         datefmt="%H:%M:%S",
     )
+    # httpx logs every request at INFO; requests/urllib3 only did so at DEBUG
+    logging.getLogger("httpx").setLevel(level if verbose else logging.WARNING)
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="foa-extract",
         description="Extract and tag Funding Opportunity Announcements from Grants.gov and NSF",
     )
     parser.add_argument(
         "--url",
-        required=True,
-        help="URL of the Grants.gov or NSF opportunity page",
+        nargs="+",
+        default=[],
+        help="URL(s) of Grants.gov or NSF opportunity pages",
+    )
+    parser.add_argument(
+        "--url-file",
+        help="File with one opportunity URL per line",
     )
     parser.add_argument(
         "--out-dir",
@@ -36,7 +63,7 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     )
     parser.add_argument(
         "--format",
-        choices=["json", "csv", "all"],
+        choices=FORMATS,
         default="all",
         help="Output format: json, csv, or all (default: all)",
     )
@@ -45,57 +72,260 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Disable TF-IDF NLP tagging (use keyword matching only)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached pages and results (fresh results are still cached)",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
         help="Enable debug logging",
     )
-    return parser.parse_args(argv)
+    args = parser.parse_args(argv)
+    if not args.url and not args.url_file:
+        parser.error("one of --url or --url-file is required")
+    return args
 
 
-def main(argv: list[str] | None = None) -> int:
-    args = parse_args(argv)
-    setup_logging(args.verbose)
-    log = logging.getLogger(__name__)
+_VALUE_OPTIONS = {"--url-file": "url_file", "--out-dir": "out_dir", "--format": "format"}
+_FLAG_OPTIONS = {"--no-nlp": "no_nlp", "--no-cache": "no_cache", "--verbose": "verbose"}
+
+
+def _fast_parse(argv: list[str]) -> SimpleNamespace | None:
+    """Parse the common, well-formed command lines without argparse.
+
+    Returns ``None`` for anything else (``--help``, ``--opt=value``,
+    abbreviations, missing or invalid values), so the caller can fall
+    back to ``parse_args`` for its full handling and error messages.
+    """
+    args = SimpleNamespace(
+        url=[], url_file=None, out_dir="./out", format="all",
+        no_nlp=False, no_cache=False, verbose=False,
+    )
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        if arg == "--url":
+            start = i
+            while i < len(argv) and not argv[i].startswith("-"):
+                i += 1
+            if i == start:
+                return None
+            args.url = argv[start:i]
+        elif arg in _VALUE_OPTIONS:
+            if i == len(argv) or argv[i].startswith("-"):
+                return None
+            setattr(args, _VALUE_OPTIONS[arg], argv[i])
+            i += 1
+        elif arg in _FLAG_OPTIONS:
+            setattr(args, _FLAG_OPTIONS[arg], True)
+        else:
+            return None
+
+    if args.format not in FORMATS or not (args.url or args.url_file):
+        return None
+    return args
+
+
+def read_urls(args: argparse.Namespace) -> list[str]:
+    urls = list(args.url)
+    if args.url_file:
+        with open(args.url_file, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    urls.append(line)
+    return list(dict.fromkeys(urls))
+
+
+def opportunity_out_dirs(
+    out_dir: str | Path,
+    opportunities: list[FundingOpportunity],
+) -> list[Path]:
+    """Per-opportunity output directories used when several URLs are given.
+
+    Directories are named after the FOA ID; repeated IDs (e.g. several
+    ``NSF-UNKNOWN``) get ``-2``, ``-3``... suffixes so no export
+    overwrites another.
+    """
+    used: set[str] = set()
+    dirs = []
+    for opportunity in opportunities:
+        base = re.sub(r"[^\w.-]+", "_", opportunity.foa_id) or "unknown"
+        name, n = base, 1
+        while name in used:
+            n += 1
+            name = f"{base}-{n}"
+        used.add(name)
+        dirs.append(Path(out_dir) / name)
+    return dirs
+
+
+class _Lazy:
+    """Log argument that is only built if a handler formats the record."""
+
+    __slots__ = ("func", "args")
+
+    def __init__(self, func, *args) -> None:
+        self.func = func
+        self.args = args
+
+    def __str__(self) -> str:
+        return str(self.func(*self.args))
+
 
-    log.info("URL: %s", args.url)
-    log.info("Output directory: %s", Path(args.out_dir).resolve())
-    log.info("Format: %s", args.format)
-    log.info("NLP tagging: %s", "disabled" if args.no_nlp else "enabled")
+def _display_path(path: str | Path) -> Path:
+    # resolve() stats every path component, so only pay for it in debug output
+    path = Path(path)
+    return path.resolve() if logger.isEnabledFor(logging.DEBUG) else path
+
+
+def run(
+    urls: str | list[str],
+    out_dir: str | Path = "./out",
+    fmt: str = "all",
+    use_nlp: bool = True,
+    no_cache: bool = False,
+) -> int:
+    """Ingest, tag and export ``urls``; returns the CLI exit code.
+
+    Library entry point that skips argument parsing; ``main`` calls it
+    after parsing ``argv``. Logging is left to the caller. From code that
+    already runs an event loop, await ``run_async`` instead.
+    """
+    import asyncio
 
     try:
-        log.info("Extracting metadata...")
-        opportunity = ingest(args.url)
-        log.info("Title: %s", opportunity.title)
-        log.info("Agency: %s", opportunity.agency)
-        log.info("FOA ID: %s", opportunity.foa_id)
-
-        log.info("Applying tags...")
-        use_nlp = not args.no_nlp
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError("run() cannot be called from a running event loop; await run_async()")
+
+    return asyncio.run(run_async(urls, out_dir, fmt=fmt, use_nlp=use_nlp, no_cache=no_cache))
+
+
+async def run_async(
+    urls: str | list[str],
+    out_dir: str | Path = "./out",
+    fmt: str = "all",
+    use_nlp: bool = True,
+    no_cache: bool = False,
+) -> int:
+    """Async counterpart of ``run``; ``no_cache`` skips cached pages and results."""
+    import asyncio
+    from contextlib import nullcontext
+
+    from foa_extract.cache import bypass_cache
+    from foa_extract.ingestor import ingest_many
+
+    if isinstance(urls, str):
+        urls = [urls]
+
+    for url in urls:
+        logger.info("URL: %s", url)
+    logger.info("Output directory: %s", _Lazy(_display_path, out_dir))
+    logger.info("Format: %s", fmt)
+    logger.info("NLP tagging: %s", "enabled" if use_nlp else "disabled")
+
+    with bypass_cache() if no_cache else nullcontext():
+        try:
+            logger.info("Extracting metadata...")
+            results = await ingest_many(urls, return_exceptions=True)
+            # Tagging and export block, so keep them off the event loop
+            return await asyncio.to_thread(_tag_and_export, urls, results, out_dir, fmt, use_nlp)
+        except Exception as exc:
+            return _report_error(exc)
+
+
+def _tag_and_export(
+    urls: list[str],
+    results: list[FundingOpportunity | BaseException],
+    out_dir: str | Path,
+    fmt: str,
+    use_nlp: bool,
+) -> int:
+    from foa_extract.exporter import export_many
+    from foa_extract.tagger import apply_tags
+
+    opportunities = []
+    exit_code = 0
+    failed = 0
+    for url, result in zip(urls, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            failed += 1
+            exit_code = exit_code or _report_error(result, url)
+        else:
+            opportunities.append(result)
+
+    formats = [fmt] if fmt != "all" else ["json", "csv"]
+
+    for opportunity in opportunities:
+        logger.info("Title: %s", opportunity.title)
+        logger.info("Agency: %s", opportunity.agency)
+        logger.info("FOA ID: %s", opportunity.foa_id)
+
+        logger.info("Applying tags...")
         tags = apply_tags(opportunity.title, opportunity.description, use_nlp=use_nlp)
         opportunity.tags = tags
-        log.info("Tags: %s", ", ".join(tags) if tags else "none")
+        logger.info("Tags: %s", _Lazy(", ".join, tags) if tags else "none")
 
-        log.info("Exporting results...")
-        formats = [args.format] if args.format != "all" else ["json", "csv"]
-        results = export_all(opportunity, args.out_dir, formats=formats)
-        for fmt, path in results.items():
-            log.info("%s -> %s", fmt.upper(), path.resolve())
+    if len(urls) > 1:
+        targets = opportunity_out_dirs(out_dir, opportunities)
+    else:
+        targets = [out_dir] * len(opportunities)
 
-        log.info("Done.")
-        return 0
+    if opportunities:
+        logger.info("Exporting results...")
+        for exported in export_many(list(zip(opportunities, targets)), formats=formats):
+            for name, path in exported.items():
+                logger.info("%s -> %s", name.upper(), _Lazy(_display_path, path))
+
+    if failed:
+        logger.error("Done; %d of %d URLs failed.", failed, len(urls))
+    else:
+        logger.info("Done.")
+    return exit_code
 
-    except ValueError as exc:
-        log.error("Validation error: %s", exc)
-        return 1
 
-    except ConnectionError as exc:
-        log.error("Connection error: %s", exc)
+def _report_error(exc: Exception, url: str | None = None) -> int:
+    """Log ``exc`` and return the matching CLI exit code."""
+    where = f" for {url}" if url else ""
+    if isinstance(exc, ValueError):
+        logger.error("Validation error%s: %s", where, exc)
+        return 1
+    if isinstance(exc, ConnectionError):
+        logger.error("Connection error%s: %s", where, exc)
         return 2
+    logger.error("Unexpected error%s: %s", where, exc)
+    # Only pay for formatting the traceback when --verbose asked for it
+    logger.debug("Traceback:", exc_info=exc)
+    return 3
+
 
-    except Exception as exc:
-        log.exception("Unexpected error: %s", exc)
-        return 3
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _fast_parse(argv) or parse_args(argv)
+    setup_logging(args.verbose)
+
+    try:
+        urls = read_urls(args)
+    except OSError as exc:
+        logger.error("Cannot read URL file: %s", exc)
+        return 1
+
+    return run(
+        urls,
+        out_dir=args.out_dir,
+        fmt=args.format,
+        use_nlp=not args.no_nlp,
+        no_cache=args.no_cache,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,111 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from foa_extract import cache, ingestor
+from foa_extract.ingestor import GrantsGovIngestor, IngestorFactory, NSFIngestor
+
+NSF_URL = "https://www.nsf.gov/awardsearch/showAward?AWD_ID=123"
+GRANTS_URL = "https://www.grants.gov/search-results-detail/123"
+
+
+@pytest.mark.parametrize("body", ["", "   ", "<!-- x -->"])
+def test_nsf_parse_blank_body_falls_back_to_defaults(body):
+    opportunity = NSFIngestor().parse(body, NSF_URL)
+    assert opportunity.foa_id == "NSF-123"
+    assert opportunity.title == "Unknown"
+    assert opportunity.agency == "National Science Foundation"
+    assert opportunity.description == ""
+
+
+@pytest.mark.parametrize("body", ["", "   ", "<!-- x -->"])
+def test_grants_html_blank_body_falls_back_to_defaults(body):
+    opportunity = GrantsGovIngestor()._parse_html(body, GRANTS_URL, "123")
+    assert opportunity.title == "Unknown"
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.grants.gov./search-results-detail/123",
+    "https://WWW.Grants.Gov/search-results-detail/123",
+    "https://grants.gov/search-results-detail/123",
+])
+def test_factory_resolves_hostname_variants(url):
+    assert isinstance(IngestorFactory.get_ingestor(url), GrantsGovIngestor)
+
+
+def test_factory_rejects_lookalike_domain():
+    with pytest.raises(ValueError):
+        IngestorFactory.get_ingestor("https://notgrants.gov/123")
+
+
+def test_ingest_many_limits_by_fetched_host(monkeypatch):
+    seen = []
+
+    async def fake_ingest_async(client, url, sem=None, pool=None):
+        seen.append(sem)
+        return url
+
+    monkeypatch.setattr(ingestor, "ingest_async", fake_ingest_async)
+    asyncio.run(ingestor.ingest_many([
+        "https://grants.gov/search-results-detail/1",
+        "https://www.grants.gov/search-results-detail/2",
+    ]))
+    # Both map to the same API host, so they share one semaphore
+    assert seen[0] is seen[1]
+
+
+API_BODY = json.dumps({"opportunityTitle": "T", "opportunityNumber": "N-123", "synopsis": {}})
+
+
+@pytest.fixture
+def grants_server(monkeypatch, tmp_path):
+    """Fresh disk cache plus a fake Grants.gov; returns the request log."""
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cache, "_cache", None)
+    monkeypatch.delenv("FOA_NOCACHE", raising=False)
+    requests = []
+    state = {"head_status": 200}
+
+    def handler(request):
+        requests.append(request.method)
+        if request.method == "HEAD":
+            return httpx.Response(state["head_status"], headers={"ETag": '"v1"'})
+        return httpx.Response(200, headers={"ETag": '"v1"'}, text=API_BODY)
+
+    monkeypatch.setattr(ingestor, "_SESSION", httpx.Client(transport=httpx.MockTransport(handler)))
+    return requests, state
+
+
+def test_ingest_skips_head_while_cached_result_is_fresh(grants_server):
+    requests, _ = grants_server
+    assert ingestor.ingest(GRANTS_URL).foa_id == "N-123"
+    assert requests == ["HEAD", "GET"]
+    assert ingestor.ingest(GRANTS_URL).foa_id == "N-123"
+    assert requests == ["HEAD", "GET"]
+
+
+def test_ingest_revalidates_expired_result(grants_server, monkeypatch):
+    requests, _ = grants_server
+    ingestor.ingest(GRANTS_URL)
+    monkeypatch.setattr(ingestor, "INGEST_TTL", 0)
+    assert ingestor.ingest(GRANTS_URL).foa_id == "N-123"
+    assert requests == ["HEAD", "GET", "HEAD"]
+
+
+def test_ingest_fetches_normally_when_head_fails(grants_server):
+    requests, state = grants_server
+    state["head_status"] = 503
+    assert ingestor.ingest(GRANTS_URL).foa_id == "N-123"
+    assert requests == ["HEAD", "GET"]
+
+
+def test_bypass_cache_skips_fresh_result(grants_server):
+    requests, _ = grants_server
+    ingestor.ingest(GRANTS_URL)
+    with cache.bypass_cache():
+        assert cache.refresh_requested()
+        assert ingestor.ingest(GRANTS_URL).foa_id == "N-123"
+    assert not cache.refresh_requested()
+    assert requests.count("GET") == 2
@@ -0,0 +1,13 @@
+import asyncio
+
+import pytest
+
+import main
+
+
+def test_run_refuses_running_event_loop():
+    async def call_run():
+        main.run("https://www.nsf.gov/awardsearch/showAward?AWD_ID=123")
+
+    with pytest.raises(RuntimeError, match="run_async"):
+        asyncio.run(call_run())
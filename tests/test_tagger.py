@@ -0,0 +1,53 @@
+import random
+
+import numpy as np
+import pytest
+
+from foa_extract import tagger
+
+sklearn_text = pytest.importorskip("sklearn.feature_extraction.text")
+sklearn_pairwise = pytest.importorskip("sklearn.metrics.pairwise")
+
+
+def _reference_similarities(text):
+    """Scores from fitting TfidfVectorizer on the categories plus ``text``."""
+    corpus = list(tagger.TFIDF_CATEGORY_DESCRIPTIONS.values()) + [text]
+    vectorizer = sklearn_text.TfidfVectorizer(
+        stop_words="english",
+        max_features=tagger.TFIDF_MAX_FEATURES,
+        ngram_range=(1, 2),
+    )
+    matrix = vectorizer.fit_transform(corpus)
+    return sklearn_pairwise.cosine_similarity(matrix[-1], matrix[:-1]).ravel()
+
+
+def _documents():
+    rng = random.Random(0)
+    vocab = " ".join(tagger.TFIDF_CATEGORY_DESCRIPTIONS.values()).split()
+    docs = [
+        " ".join(rng.choice(vocab) for _ in range(rng.randint(5, 80)))
+        for _ in range(40)
+    ]
+    # Enough distinct terms to hit the max_features cut, with many ties
+    filler = [f"w{i}" for i in range(3000)]
+    docs += [
+        " ".join(rng.choice(filler + vocab) for _ in range(6000))
+        for _ in range(3)
+    ]
+    docs += ["the and of which would", "Small Business Innovation Research phase I"]
+    return docs
+
+
+@pytest.mark.parametrize("text", _documents())
+def test_tfidf_similarities_match_tfidf_vectorizer(text):
+    model = tagger._category_model()
+    expected = _reference_similarities(text)
+    np.testing.assert_allclose(
+        tagger._tfidf_similarities(model, text), expected, rtol=0, atol=1e-12,
+    )
+
+
+def test_tags_key_changes_with_sklearn_version(monkeypatch):
+    key = tagger._tags_key("title", "description", 0.08)
+    monkeypatch.setattr(tagger, "_sklearn_version", lambda: "0.0.0")
+    assert tagger._tags_key("title", "description", 0.08) != key